@@ -1,29 +1,22 @@
 import { NextRequest, NextResponse } from "next/server";
 import { spawn } from "child_process";
 import path from "path";
+import { recolorFlowerData, type FlowerData } from "@/lib/flower-api";
 
 /**
- * GET /api/flower?seed=xxx&bloom=0.6&message=...
- * Python flower_generator.py를 실행하고 JSON 응답 반환
+ * 색상과 무관한 꽃 형태(geometry) 캐시
+ * key: seed / bloom / flowers / message 길이 (색상은 서빙 시점에 recolorFlowerData로 적용)
  */
-export async function GET(request: NextRequest) {
-  const { searchParams } = new URL(request.url);
-  const seed = searchParams.get("seed") ?? "default";
-  const bloom = Math.min(1, Math.max(0, parseFloat(searchParams.get("bloom") ?? "0.6")));
-  const flowers = searchParams.get("flowers") ?? "";
-  const message = searchParams.get("message") ?? "";
-  const color = searchParams.get("color") ?? "";
-  const colors = searchParams.get("colors") ?? "";
+const GEOMETRY_CACHE_LIMIT = 500;
+const geometryCache = new Map<string, FlowerData>();
 
-  const scriptPath = path.join(process.cwd(), "python", "flower_generator.py");
-  const args = ["--seed", seed, "--bloom", String(bloom), "--message", message, "--json"];
-  if (flowers) args.splice(-1, 0, "--flowers", flowers);
-  if (colors) args.splice(-1, 0, "--colors", colors);
-  else if (color) args.splice(-1, 0, "--color", color);
+type GeneratorError = { error: string; detail?: string; raw?: string };
 
+function runGenerator(args: string[]): Promise<FlowerData> {
+  const scriptPath = path.join(process.cwd(), "python", "flower_generator.py");
   const py = process.platform === "win32" ? "python" : "python3";
 
-  return new Promise<NextResponse>((resolve) => {
+  return new Promise<FlowerData>((resolve, reject) => {
     const proc = spawn(py, [scriptPath, ...args], {
       cwd: process.cwd(),
       env: { ...process.env },
@@ -42,35 +35,57 @@ export async function GET(request: NextRequest) {
     proc.on("close", (code) => {
       if (code !== 0) {
         console.error("[flower] Python stderr:", stderr);
-        resolve(
-          NextResponse.json(
-            { error: "Flower generation failed", detail: stderr || "Unknown error" },
-            { status: 500 }
-          )
-        );
+        reject({ error: "Flower generation failed", detail: stderr || "Unknown error" } as GeneratorError);
         return;
       }
 
       try {
-        const data = JSON.parse(stdout.trim());
-        resolve(NextResponse.json(data));
+        resolve(JSON.parse(stdout.trim()));
       } catch {
-        resolve(
-          NextResponse.json(
-            { error: "Invalid JSON from flower generator", raw: stdout.slice(0, 200) },
-            { status: 500 }
-          )
-        );
+        reject({ error: "Invalid JSON from flower generator", raw: stdout.slice(0, 200) } as GeneratorError);
       }
     });
 
     proc.on("error", (err) => {
-      resolve(
-        NextResponse.json(
-          { error: "Failed to run Python", detail: String(err.message) },
-          { status: 500 }
-        )
-      );
+      reject({ error: "Failed to run Python", detail: String(err.message) } as GeneratorError);
     });
   });
 }
+
+/**
+ * GET /api/flower?seed=xxx&bloom=0.6&message=...
+ * Python flower_generator.py로 색상 없이 형태를 생성(캐시)한 뒤 color/colors를 입혀 JSON 응답 반환
+ */
+export async function GET(request: NextRequest) {
+  const { searchParams } = new URL(request.url);
+  const seed = searchParams.get("seed") ?? "default";
+  const bloom = Math.min(1, Math.max(0, parseFloat(searchParams.get("bloom") ?? "0.6")));
+  const flowers = searchParams.get("flowers") ?? "";
+  const message = searchParams.get("message") ?? "";
+  const color = searchParams.get("color") ?? "";
+  const colors = (searchParams.get("colors") ?? "")
+    .split(",")
+    .map((c) => c.trim())
+    .filter(Boolean);
+
+  const key = JSON.stringify([seed, bloom, flowers, message.length]);
+  let geometry = geometryCache.get(key);
+
+  if (!geometry) {
+    const args = ["--seed", seed, "--bloom", String(bloom), "--message", message, "--json"];
+    if (flowers) args.splice(-1, 0, "--flowers", flowers);
+
+    try {
+      geometry = await runGenerator(args);
+    } catch (err) {
+      return NextResponse.json(err as GeneratorError, { status: 500 });
+    }
+
+    if (geometryCache.size >= GEOMETRY_CACHE_LIMIT) {
+      geometryCache.delete(geometryCache.keys().next().value as string);
+    }
+    geometryCache.set(key, geometry);
+  }
+
+  return NextResponse.json(recolorFlowerData(geometry, colors.length ? { colors } : { color }));
+}
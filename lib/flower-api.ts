@@ -9,6 +9,7 @@ export type FlowerData = {
     bloom: number;
     flower_type: "single" | "cluster" | "bouquet";
     flower_color: string;
+    flower_colors?: string[];
     background_color: string;
   };
   animation: {
@@ -58,6 +59,26 @@ export type FlowerApiParams = {
   colors?: string[]; // 여러 꽃 색상
 };
 
+/**
+ * 형태(geometry) 데이터에 꽃 색상만 입힌 사본 반환 (python recolor()와 동일 규칙)
+ * 좌표는 그대로 공유 → 색상 조합마다 꽃을 다시 생성할 필요 없음
+ */
+export function recolorFlowerData(
+  data: FlowerData,
+  { color, colors }: { color?: string; colors?: string[] }
+): FlowerData {
+  const flowerColor = color || data.params.flower_color;
+  const flowerColors = colors?.length ? colors : [flowerColor];
+  return {
+    ...data,
+    params: { ...data.params, flower_color: flowerColor, flower_colors: flowerColors },
+    layers: {
+      ...data.layers,
+      flowers: data.layers.flowers.map((f, i) => ({ ...f, color: flowerColors[i % flowerColors.length] })),
+    },
+  };
+}
+
 export async function fetchFlowerData(params: FlowerApiParams): Promise<FlowerData> {
   const q = new URLSearchParams({
     seed: params.seed,
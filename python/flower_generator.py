@@ -9,6 +9,7 @@ seed에 따라 결정적으로 같은 결과를 만듭니다.
 
 import json
 import math
+import re
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -30,6 +31,10 @@ COLOR_PALETTES: list[dict[str, str]] = [
     {"flower": "#F08080", "background": "#fff0f0"},   # coral
 ]
 
+# 줄기/가지 기본 색상
+STEM_COLOR = "#5a8f5a"
+BRANCH_COLOR = "#5c935c"
+
 
 @dataclass
 class FlowerParams:
@@ -63,28 +68,57 @@ def _random(rng_state: list[int], min_val: float, max_val: float) -> float:
     return min_val + t * (max_val - min_val)
 
 
-def _derive_flower_style(
-    seed_int: int,
-    bloom: float,
-    message_length: int,
-) -> tuple[str, str, str]:
+def _derive_flower_style(bloom: float, message_length: int) -> str:
     """
-    seed / bloom / message_length → flower_type, flower_color, background_color
+    bloom / message_length → flower_type (single / cluster / bouquet)
     """
-    # flower_type: single / cluster / bouquet
     intensity = bloom * 0.6 + min(1.0, message_length / 30) * 0.4
     if intensity < 0.35:
-        flower_type = "single"
-    elif intensity < 0.65:
-        flower_type = "cluster"
-    else:
-        flower_type = "bouquet"
+        return "single"
+    if intensity < 0.65:
+        return "cluster"
+    return "bouquet"
 
-    # palette: seed 기반 결정적 선택
+
+def _seed_palette(seed_int: int) -> dict[str, str]:
+    """seed 기반 결정적 팔레트 선택"""
     palette_idx = (seed_int % len(COLOR_PALETTES) + len(COLOR_PALETTES)) % len(COLOR_PALETTES)
-    palette = COLOR_PALETTES[palette_idx]
+    return COLOR_PALETTES[palette_idx]
+
+
+def normalize_palette(palette: dict[str, Any]) -> dict[str, Any]:
+    """
+    COLOR_PALETTES 항목 또는 resolve_palette() 결과 → 모든 슬롯이 채워진 팔레트.
+    flowers가 없으면 [flower], stem/branch가 없으면 기본 색상.
+    """
+    flower = palette.get("flower") or palette["flowers"][0]
+    return {
+        "flower": flower,
+        "flowers": palette.get("flowers") or [flower],
+        "background": palette["background"],
+        "stem": palette.get("stem", STEM_COLOR),
+        "branch": palette.get("branch", BRANCH_COLOR),
+    }
 
-    return flower_type, palette["flower"], palette["background"]
+
+def resolve_palette(
+    seed: int | str | None = None,
+    flower_color: str | None = None,
+    flower_colors: list[str] | None = None,
+    background_color: str | None = None,
+) -> dict[str, Any]:
+    """
+    seed 자동 팔레트 + 사용자 지정 색 → 팔레트 슬롯 값.
+    seed가 없으면 COLOR_PALETTES[0]을 기본으로 사용.
+    형태(geometry)와 무관하므로 같은 꽃에 여러 색 조합을 적용할 수 있음.
+    """
+    auto = COLOR_PALETTES[0] if seed is None else _seed_palette(_hash_seed(seed))
+    single_color = flower_color or auto["flower"]
+    return normalize_palette({
+        "flower": single_color,
+        "flowers": flower_colors,
+        "background": background_color or auto["background"],
+    })
 
 
 # =============================================================================
@@ -373,12 +407,13 @@ def generate_flower(params: FlowerParams) -> dict[str, Any]:
     seed_int = _hash_seed(params.seed)
     rng = [seed_int]
 
-    flower_type, auto_flower_color, auto_bg = _derive_flower_style(
-        seed_int, params.bloom, params.message_length
+    flower_type = _derive_flower_style(params.bloom, params.message_length)
+    palette = resolve_palette(
+        seed_int, params.flower_color, params.flower_colors, params.background_color
     )
-    single_color = params.flower_color or auto_flower_color
-    flower_colors = params.flower_colors or [single_color]
-    background_color = params.background_color or auto_bg
+    single_color = palette["flower"]
+    flower_colors = palette["flowers"]
+    background_color = palette["background"]
 
     # (1) 굵은 줄기 없음. 가지는 바닥(시드)에서 바로 시작.
     VIEW_HEIGHT = 240
@@ -447,7 +482,6 @@ def generate_flower(params: FlowerParams) -> dict[str, Any]:
     }
 
     def scale_path(d: str) -> str:
-        import re
         def repl(m: object) -> str:
             x, y = float(m.group(1)), float(m.group(2))
             sx, sy = scale_pt(x, y)
@@ -523,8 +557,9 @@ def generate_flower(params: FlowerParams) -> dict[str, Any]:
 # 6. SVG 출력
 # =============================================================================
 
-def flower_to_svg_path(flower: FlowerData, color: str) -> str:
-    """꽃 1개를 SVG path 문자열로"""
+def flower_to_svg_path(flower: FlowerData, color: str | None) -> str:
+    """꽃 1개를 SVG path 문자열로. color=None이면 fill 생략 (부모 그룹에서 상속)"""
+    fill = f' fill="{color}"' if color else ""
     angle_step = 360 / flower.petal_count
     paths: list[str] = []
 
@@ -536,25 +571,48 @@ def flower_to_svg_path(flower: FlowerData, color: str) -> str:
             flower.petal_length,
             flower.petal_width,
         )
-        paths.append(f'<path d="{d}" fill="{color}" opacity="0.9"/>')
+        paths.append(f'<path d="{d}"{fill} opacity="0.9"/>')
 
     # 중심
     paths.append(
-        f'<circle cx="{flower.cx:.2f}" cy="{flower.cy:.2f}" r="{flower.center_radius:.1f}" fill="{color}"/>'
+        f'<circle cx="{flower.cx:.2f}" cy="{flower.cy:.2f}" r="{flower.center_radius:.1f}"{fill}/>'
     )
     return "\n    ".join(paths)
 
 
-def to_svg(data: dict[str, Any], animate: bool = False) -> str:
-    """JSON 데이터를 SVG 문자열로 변환. animate=True시 data-delay/data-duration 포함."""
+# 슬롯 SVG를 apply_palette() 없이 그대로 표시할 때의 기본 색상 (pink 팔레트)
+SLOT_DEFAULTS: dict[str, str] = {
+    "bg": COLOR_PALETTES[0]["background"],
+    "stem": STEM_COLOR,
+    "branch": BRANCH_COLOR,
+    "flower": COLOR_PALETTES[0]["flower"],
+}
+
+
+def _slot_var(slot: str) -> str:
+    default = SLOT_DEFAULTS["flower" if slot.startswith("flower-") else slot]
+    return f"var(--{slot}, {default})"
+
+
+def to_svg(data: dict[str, Any], animate: bool = False, slots: bool = False) -> str:
+    """
+    JSON 데이터를 SVG 문자열로 변환. animate=True시 data-delay/data-duration 포함.
+    slots=True시 색상 대신 CSS 변수(--bg, --stem, --branch, --flower-N) 슬롯으로 출력 →
+    apply_palette()로 색만 입히면 되므로 형태 하나를 모든 색 조합에 재사용 가능.
+    """
     params = data["params"]
     layers = data["layers"]
     bg = params["background_color"]
-    stem_color = "#5a8f5a"
-    branch_color = "#5c935c"
+    stem_color = STEM_COLOR
+    branch_color = BRANCH_COLOR
     flower_color = params["flower_color"]
     anim = data.get("animation", {})
 
+    def _paint(prop: str, color: str, slot: str) -> str:
+        if slots:
+            return f'style="{prop}:{_slot_var(slot)}"'
+        return f'{prop}="{color}"'
+
     def _attr(elem: dict, prefix: str) -> str:
         if not animate:
             return ""
@@ -562,16 +620,17 @@ def to_svg(data: dict[str, Any], animate: bool = False) -> str:
         dur = anim.get(f"{prefix}_duration", 500)
         return f' data-delay="{d}" data-duration="{dur}"'
 
+    slot_attr = f' data-flower-slots="{len(layers["flowers"])}"' if slots else ""
     svg_parts: list[str] = [
-        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{data["viewBox"]}" width="320" height="240">',
-        f'  <rect width="100%" height="100%" fill="{bg}"/>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{data["viewBox"]}" width="320" height="240"{slot_attr}>',
+        f'  <rect width="100%" height="100%" {_paint("fill", bg, "bg")}/>',
         '  <g id="layer-stem" data-layer="stem">',
     ]
     s0 = layers["stem"]["segments"][0]
     svg_parts.append(
         f'    <line id="{s0.get("id","stem-0")}" x1="{s0["x1"]:.1f}" y1="{s0["y1"]:.1f}" '
         f'x2="{s0["x2"]:.1f}" y2="{s0["y2"]:.1f}" '
-        f'stroke="{stem_color}" stroke-width="2.5" stroke-linecap="round"'
+        f'{_paint("stroke", stem_color, "stem")} stroke-width="2.5" stroke-linecap="round"'
         f'{_attr(s0, "stem")}/>'
     )
     svg_parts.append("  </g>")
@@ -580,13 +639,13 @@ def to_svg(data: dict[str, Any], animate: bool = False) -> str:
     for seg in layers["branches"]["segments"]:
         svg_parts.append(
             f'    <path id="{seg.get("id","")}" d="{seg["path"]}" fill="none" '
-            f'stroke="{branch_color}" stroke-width="1.5" stroke-linecap="round"'
+            f'{_paint("stroke", branch_color, "branch")} stroke-width="1.5" stroke-linecap="round"'
             f'{_attr(seg, "branch")}/>'
         )
     svg_parts.append("  </g>")
     svg_parts.append('  <g id="layer-flowers" data-layer="flowers">')
 
-    for f in layers["flowers"]:
+    for i, f in enumerate(layers["flowers"]):
         fd = FlowerData(
             cx=f["cx"], cy=f["cy"], petal_count=f["petal_count"],
             petal_length=f["petal_length"], petal_width=f["petal_width"],
@@ -595,6 +654,9 @@ def to_svg(data: dict[str, Any], animate: bool = False) -> str:
         )
         color = f.get("color") or flower_color
         extra = f' id="{f.get("id","")}"{_attr(f, "flower")}' if animate else ""
+        if slots:
+            extra += f' {_paint("fill", color, f"flower-{i}")}'
+            color = None
         svg_parts.append(f'    <g{extra}>{flower_to_svg_path(fd, color)}</g>')
     svg_parts.append("  </g>")
     svg_parts.append("</svg>")
@@ -603,7 +665,71 @@ def to_svg(data: dict[str, Any], animate: bool = False) -> str:
 
 
 # =============================================================================
-# 7. CLI 진입점
+# 7. 색상 입히기 (형태와 분리)
+# =============================================================================
+
+def palette_css(palette: dict[str, Any], flower_slots: int) -> str:
+    """
+    팔레트 → 슬롯 CSS 변수 선언 (svg 루트 style 속성용). 꽃 i번에는 flowers[i % len] 색상.
+    COLOR_PALETTES 항목을 그대로 넘겨도 됨.
+    """
+    palette = normalize_palette(palette)
+    flowers = palette["flowers"]
+    decls = [
+        f"--bg:{palette['background']}",
+        f"--stem:{palette['stem']}",
+        f"--branch:{palette['branch']}",
+    ]
+    decls += [f"--flower-{i}:{flowers[i % len(flowers)]}" for i in range(flower_slots)]
+    return ";".join(decls)
+
+
+def apply_palette(svg: str, palette: dict[str, Any]) -> str:
+    """
+    to_svg(slots=True) 결과에 팔레트를 입힘.
+    svg 루트의 style 속성만 덮어쓰므로 형태(path 좌표)는 건드리지 않고,
+    여러 번 적용하거나 HTML에 여러 개 인라인해도 서로 영향 없음.
+    """
+    m = re.search(r'<svg\b[^>]*>', svg)
+    if m is None:
+        raise ValueError("SVG root element not found")
+    root = m.group(0)
+    slots_m = re.search(r'data-flower-slots="(\d+)"', root)
+    if slots_m is None:
+        raise ValueError("SVG was not rendered with palette slots (to_svg(slots=True))")
+    style = f'style="{palette_css(palette, int(slots_m.group(1)))}"'
+    root = re.sub(r'\sstyle="[^"]*"', "", root)
+    root = root[:-1] + f" {style}>"
+    return svg[:m.start()] + root + svg[m.end():]
+
+
+def recolor(data: dict[str, Any], palette: dict[str, Any]) -> dict[str, Any]:
+    """
+    generate_flower() JSON에 다른 팔레트를 적용한 사본 반환.
+    layers의 좌표 데이터는 그대로 공유하고 params·꽃 색상만 교체.
+    """
+    palette = normalize_palette(palette)
+    flowers = palette["flowers"]
+    return {
+        **data,
+        "params": {
+            **data["params"],
+            "flower_color": palette["flower"],
+            "flower_colors": flowers,
+            "background_color": palette["background"],
+        },
+        "layers": {
+            **data["layers"],
+            "flowers": [
+                {**f, "color": flowers[i % len(flowers)]}
+                for i, f in enumerate(data["layers"]["flowers"])
+            ],
+        },
+    }
+
+
+# =============================================================================
+# 8. CLI 진입점
 # =============================================================================
 
 def main():
@@ -620,6 +746,7 @@ def main():
     parser.add_argument("--output", type=str, default="flower.svg", help="SVG 출력 경로")
     parser.add_argument("--json", action="store_true", help="JSON만 출력")
     parser.add_argument("--animate", action="store_true", help="SVG에 data-delay/data-duration 추가")
+    parser.add_argument("--slots", action="store_true", help="색상 없이 CSS 변수 슬롯으로 SVG 출력 (apply_palette로 색 적용)")
     args = parser.parse_args()
 
     flower_colors = None
@@ -641,7 +768,7 @@ def main():
     if args.json:
         print(json.dumps(data, indent=2, ensure_ascii=False))
     else:
-        svg = to_svg(data, animate=args.animate)
+        svg = to_svg(data, animate=args.animate, slots=args.slots)
         with open(args.output, "w", encoding="utf-8") as f:
             f.write(svg)
         print(f"Saved: {args.output}")
@@ -0,0 +1,45 @@
+from flower_generator import (
+    COLOR_PALETTES,
+    FlowerParams,
+    apply_palette,
+    generate_flower,
+    recolor,
+    resolve_palette,
+    to_svg,
+)
+
+
+def _generate(seed, **colors):
+    return generate_flower(FlowerParams(seed=seed, bloom=0.6, flower_count=5, **colors))
+
+
+def test_slot_svg_is_independent_of_colors():
+    base = to_svg(_generate("blooming-42"), slots=True)
+    assert to_svg(_generate("blooming-42", flower_color="#123456"), slots=True) == base
+    assert to_svg(_generate("blooming-42", flower_colors=["#111111", "#222222"],
+                            background_color="#000000"), slots=True) == base
+
+
+def test_recolor_matches_direct_generation():
+    for colors in (
+        {"flower_colors": ["#111111", "#222222", "#333333"]},
+        {"flower_color": "#abcdef", "background_color": "#000000"},
+    ):
+        palette = resolve_palette("blooming-42", **colors)
+        assert recolor(_generate("blooming-42"), palette) == _generate("blooming-42", **colors)
+
+
+def test_apply_palette_twice_uses_latest_colors():
+    svg = to_svg(_generate("blooming-42"), slots=True)
+    pink = resolve_palette(flower_color="#ffc0cb", background_color="#ffffff")
+    black = resolve_palette(flower_color="#000000", background_color="#000000")
+    twice = apply_palette(apply_palette(svg, pink), black)
+    assert twice == apply_palette(svg, black)
+    assert "#ffc0cb" not in twice
+    assert "--flower-0:#000000" in twice
+
+
+def test_apply_palette_accepts_color_palettes_entry():
+    svg = apply_palette(to_svg(_generate("blooming-42"), slots=True), COLOR_PALETTES[2])
+    assert f"--bg:{COLOR_PALETTES[2]['background']}" in svg
+    assert f"--flower-4:{COLOR_PALETTES[2]['flower']}" in svg